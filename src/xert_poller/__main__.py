@@ -1,12 +1,10 @@
 """Main entry point for xert-poller."""
 
-import asyncio
 import logging
-import signal
+import os
 import sys
 
-from .config import get_settings
-from .poller import run_poller
+_REQUIRED_ENV = ("XERT_USERNAME", "XERT_PASSWORD", "XERT_HA_WEBHOOK_ID")
 
 
 def setup_logging(level: str) -> None:
@@ -20,23 +18,63 @@ def setup_logging(level: str) -> None:
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
 
+def _print_usage(error: str) -> None:
+    """Print a configuration error with the expected environment variables."""
+    print(f"Configuration error: {error}", file=sys.stderr)
+    print("\nRequired environment variables:", file=sys.stderr)
+    print("  XERT_USERNAME - Xert account email", file=sys.stderr)
+    print("  XERT_PASSWORD - Xert account password", file=sys.stderr)
+    print("  XERT_HA_WEBHOOK_ID - Home Assistant webhook ID", file=sys.stderr)
+    print("\nOptional environment variables:", file=sys.stderr)
+    print("  XERT_HA_URL - Home Assistant URL (default: http://homeassistant:8123)", file=sys.stderr)
+    print("  XERT_HA_TOKEN - Home Assistant access token", file=sys.stderr)
+    print("  XERT_TRAINING_INFO_INTERVAL - Training info poll interval (default: 900)", file=sys.stderr)
+    print("  XERT_ACTIVITIES_INTERVAL - Activities poll interval (default: 900)", file=sys.stderr)
+    print("  XERT_JITTER_RATIO - Random jitter applied to poll intervals (default: 0.05)", file=sys.stderr)
+    print("  XERT_LOOKBACK_DAYS - Days of activity history (default: 90)", file=sys.stderr)
+    print("  XERT_LOG_LEVEL - Logging level (default: INFO)", file=sys.stderr)
+
+
+async def _amain(settings) -> None:
+    """Run the poller with signal handlers registered on the running loop."""
+    import asyncio
+    import signal
+
+    from .poller import run_poller
+
+    logger = logging.getLogger(__name__)
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    def request_stop(sig_name: str) -> None:
+        logger.info("Received signal %s, shutting down...", sig_name)
+        stop_event.set()
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, request_stop, sig.name)
+        except NotImplementedError:
+            # add_signal_handler is unavailable on Windows event loops
+            signal.signal(sig, lambda *_, _name=sig.name: request_stop(_name))
+
+    await run_poller(settings, stop_event)
+
+
 def main() -> None:
     """Main entry point."""
+    # Validate required env vars before paying for the heavy imports, so a
+    # misconfigured container fails fast with a clear message
+    missing = [name for name in _REQUIRED_ENV if not os.environ.get(name)]
+    if missing:
+        _print_usage(f"missing required environment variable(s): {', '.join(missing)}")
+        sys.exit(1)
+
+    from .config import get_settings
+
     try:
         settings = get_settings()
     except Exception as e:
-        print(f"Configuration error: {e}", file=sys.stderr)
-        print("\nRequired environment variables:", file=sys.stderr)
-        print("  XERT_USERNAME - Xert account email", file=sys.stderr)
-        print("  XERT_PASSWORD - Xert account password", file=sys.stderr)
-        print("  XERT_HA_WEBHOOK_ID - Home Assistant webhook ID", file=sys.stderr)
-        print("\nOptional environment variables:", file=sys.stderr)
-        print("  XERT_HA_URL - Home Assistant URL (default: http://homeassistant:8123)", file=sys.stderr)
-        print("  XERT_HA_TOKEN - Home Assistant access token", file=sys.stderr)
-        print("  XERT_TRAINING_INFO_INTERVAL - Training info poll interval (default: 900)", file=sys.stderr)
-        print("  XERT_ACTIVITIES_INTERVAL - Activities poll interval (default: 900)", file=sys.stderr)
-        print("  XERT_LOOKBACK_DAYS - Days of activity history (default: 90)", file=sys.stderr)
-        print("  XERT_LOG_LEVEL - Logging level (default: INFO)", file=sys.stderr)
+        _print_usage(str(e))
         sys.exit(1)
 
     setup_logging(settings.log_level)
@@ -48,23 +86,13 @@ def main() -> None:
     logger.info("  Activities interval: %ds", settings.activities_interval)
     logger.info("  Lookback days: %d", settings.lookback_days)
 
-    # Set up signal handlers for graceful shutdown
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-
-    def handle_signal(sig: signal.Signals) -> None:
-        logger.info("Received signal %s, shutting down...", sig.name)
-        loop.stop()
-
-    for sig in (signal.SIGTERM, signal.SIGINT):
-        loop.add_signal_handler(sig, handle_signal, sig)
+    import asyncio
 
     try:
-        loop.run_until_complete(run_poller(settings))
+        asyncio.run(_amain(settings))
     except KeyboardInterrupt:
         logger.info("Interrupted by user")
     finally:
-        loop.close()
         logger.info("Shutdown complete")
 
 
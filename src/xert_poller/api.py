@@ -6,57 +6,55 @@ from dataclasses import dataclass
 from typing import Any
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.xertonline.com/oauth"
 
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
+# Only the Authorization value varies per request
+_BASE_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "XertPoller/1.0",
+    "Cache-Control": "no-cache",
+}
+
 
 @dataclass
 class XertAPI:
     """Client for Xert API."""
 
-    _session: aiohttp.ClientSession | None = None
+    session: aiohttp.ClientSession
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._session:
-            await self._session.close()
-            self._session = None
 
     async def _get(self, endpoint: str, token: str, params: dict | None = None) -> dict | list | None:
         """Make authenticated GET request."""
-        if not self._session:
-            logger.error("API session not initialized")
-            return None
-
         url = f"{BASE_URL}{endpoint}"
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Accept": "application/json",
-            "User-Agent": "XertPoller/1.0",
-            "Cache-Control": "no-cache",
-        }
+        headers = {**_BASE_HEADERS, "Authorization": f"Bearer {token}"}
 
         try:
-            async with self._session.get(
+            async with self.session.get(
                 url,
                 headers=headers,
                 params=params,
-                timeout=aiohttp.ClientTimeout(total=30),
+                timeout=_REQUEST_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
-                    return await resp.json()
+                    return await resp.json(loads=orjson.loads)
                 elif resp.status == 401:
                     logger.warning("Unauthorized - token may be expired")
                     return None
                 else:
-                    text = await resp.text()
+                    # Read only a capped prefix of the error body for logging
+                    text = (await resp.content.read(512)).decode("utf-8", "replace")
                     logger.warning("API request failed: %d - %s", resp.status, text[:200])
                     return None
         except Exception as e:
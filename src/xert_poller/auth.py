@@ -1,13 +1,15 @@
 """OAuth2 token management for Xert API."""
 
+import asyncio
 import base64
-import json
 import logging
+import os
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -17,11 +19,8 @@ CLIENT_ID = "xert_public"
 CLIENT_SECRET = "xert_public"
 
 
-def _get_basic_auth_header() -> str:
-    """Get Basic Auth header for Xert API."""
-    credentials = f"{CLIENT_ID}:{CLIENT_SECRET}"
-    encoded = base64.b64encode(credentials.encode()).decode()
-    return f"Basic {encoded}"
+# Precomputed once: the credentials are compile-time constants
+_BASIC_AUTH_HEADER = "Basic " + base64.b64encode(f"{CLIENT_ID}:{CLIENT_SECRET}".encode()).decode()
 
 
 @dataclass
@@ -44,28 +43,26 @@ class AuthManager:
     username: str
     password: str
     token_file: str
+    session: aiohttp.ClientSession
     refresh_margin: int = 300
     _tokens: TokenData = field(default_factory=TokenData)
-    _session: aiohttp.ClientSession | None = None
+    _last_saved_blob: bytes = b""
+    _last_saved_refresh_token: str = ""
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession()
-        self._load_tokens()
+        await asyncio.to_thread(self._load_tokens)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._session:
-            await self._session.close()
-            self._session = None
 
     def _load_tokens(self) -> None:
         """Load tokens from file if exists."""
         path = Path(self.token_file)
         if path.exists():
             try:
-                data = json.loads(path.read_text())
+                data = orjson.loads(path.read_bytes())
                 self._tokens = TokenData(
                     access_token=data.get("access_token", ""),
                     refresh_token=data.get("refresh_token", ""),
@@ -75,22 +72,44 @@ class AuthManager:
             except Exception as e:
                 logger.warning("Failed to load tokens: %s", e)
 
-    def _save_tokens(self) -> None:
-        """Save tokens to file."""
+    def _write_token_file(self, blob: bytes, fsync: bool) -> None:
+        """Atomically write the serialized token blob to disk (blocking)."""
         path = Path(self.token_file)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(
-                {
-                    "access_token": self._tokens.access_token,
-                    "refresh_token": self._tokens.refresh_token,
-                    "access_expiry": self._tokens.access_expiry,
-                }
-            )
+        tmp = path.with_suffix(".json.tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, blob)
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+
+    async def _save_tokens(self) -> None:
+        """Save tokens to file, skipping the write if nothing changed."""
+        blob = orjson.dumps(
+            {
+                "access_token": self._tokens.access_token,
+                "refresh_token": self._tokens.refresh_token,
+                "access_expiry": self._tokens.access_expiry,
+            }
         )
+        if blob == self._last_saved_blob:
+            logger.debug("Tokens unchanged, skipping save")
+            return
+
+        # fsync only when the refresh token rotates; losing access_expiry
+        # churn in a crash just costs one extra refresh on restart
+        fsync = self._tokens.refresh_token != self._last_saved_refresh_token
+
+        # Offload disk I/O so token refresh doesn't block the event loop
+        await asyncio.to_thread(self._write_token_file, blob, fsync)
+        self._last_saved_blob = blob
+        self._last_saved_refresh_token = self._tokens.refresh_token
         logger.debug("Saved tokens to %s", self.token_file)
 
-    def _parse_token_response(self, data: dict) -> None:
+    async def _parse_token_response(self, data: dict) -> None:
         """Parse and store token response."""
         now = time.time()
         expires_in = data.get("expires_in", 0)
@@ -101,16 +120,13 @@ class AuthManager:
             refresh_token=data.get("refresh_token", self._tokens.refresh_token),
             access_expiry=created_at + expires_in - 5,
         )
-        self._save_tokens()
+        await self._save_tokens()
 
     async def _password_grant(self) -> bool:
         """Authenticate with username/password."""
-        if not self._session:
-            return False
-
         logger.info("Authenticating with password grant")
         try:
-            async with self._session.post(
+            async with self.session.post(
                 TOKEN_URL,
                 data={
                     "grant_type": "password",
@@ -118,13 +134,13 @@ class AuthManager:
                     "password": self.password,
                 },
                 headers={
-                    "Authorization": _get_basic_auth_header(),
+                    "Authorization": _BASIC_AUTH_HEADER,
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    self._parse_token_response(data)
+                    data = await resp.json(loads=orjson.loads)
+                    await self._parse_token_response(data)
                     logger.info("Password grant successful")
                     return True
                 else:
@@ -137,25 +153,25 @@ class AuthManager:
 
     async def _refresh_grant(self) -> bool:
         """Refresh access token using refresh token."""
-        if not self._session or not self._tokens.refresh_token:
+        if not self._tokens.refresh_token:
             return False
 
         logger.info("Refreshing access token")
         try:
-            async with self._session.post(
+            async with self.session.post(
                 TOKEN_URL,
                 data={
                     "grant_type": "refresh_token",
                     "refresh_token": self._tokens.refresh_token,
                 },
                 headers={
-                    "Authorization": _get_basic_auth_header(),
+                    "Authorization": _BASIC_AUTH_HEADER,
                     "Content-Type": "application/x-www-form-urlencoded",
                 },
             ) as resp:
                 if resp.status == 200:
-                    data = await resp.json()
-                    self._parse_token_response(data)
+                    data = await resp.json(loads=orjson.loads)
+                    await self._parse_token_response(data)
                     logger.info("Token refresh successful")
                     return True
                 else:
@@ -166,17 +182,29 @@ class AuthManager:
             logger.warning("Token refresh error: %s", e)
             return False
 
+    @property
+    def current_token_if_valid(self) -> str | None:
+        """Return the in-memory access token if it is still valid, else None.
+
+        Fast path for hot polling code: no network, no refresh logic.
+        """
+        tokens = self._tokens
+        if tokens.is_access_valid(self.refresh_margin):
+            return tokens.access_token
+        return None
+
     async def ensure_valid_token(self) -> str | None:
         """Ensure we have a valid access token, refreshing or re-authenticating as needed.
 
         Returns the access token if successful, None otherwise.
         """
         # Check if current access token is valid
-        if self._tokens.is_access_valid(self.refresh_margin):
-            return self._tokens.access_token
+        tokens = self._tokens
+        if tokens.is_access_valid(self.refresh_margin):
+            return tokens.access_token
 
         # Try refresh if we have a refresh token
-        if self._tokens.refresh_token:
+        if tokens.refresh_token:
             if await self._refresh_grant():
                 return self._tokens.access_token
 
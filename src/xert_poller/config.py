@@ -1,68 +1,64 @@
-"""Configuration management using pydantic-settings."""
+"""Configuration management from environment variables."""
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import os
+from dataclasses import dataclass
 
 
-class Settings(BaseSettings):
-    """Application settings loaded from environment variables."""
-
-    model_config = SettingsConfigDict(
-        env_prefix="XERT_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-    )
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Application settings loaded from XERT_-prefixed environment variables."""
 
     # Xert credentials
-    username: str = Field(description="Xert account username/email")
-    password: str = Field(description="Xert account password")
+    username: str
+    password: str
 
     # Home Assistant webhook
-    ha_url: str = Field(
-        default="http://homeassistant:8123",
-        description="Home Assistant base URL",
-    )
-    ha_webhook_id: str = Field(description="Webhook ID configured in Home Assistant")
-    ha_token: str = Field(
-        default="",
-        description="Home Assistant long-lived access token (optional)",
-    )
+    ha_webhook_id: str
+    ha_url: str = "http://homeassistant:8123"
+    ha_token: str = ""
 
-    # Polling intervals (seconds)
-    training_info_interval: int = Field(
-        default=900,
-        description="Training info poll interval (seconds), default 15 min",
-    )
-    activities_interval: int = Field(
-        default=900,
-        description="Activities poll interval (seconds), default 15 min",
-    )
+    # Polling intervals (seconds), default 15 min
+    training_info_interval: int = 900
+    activities_interval: int = 900
 
-    # Activity lookback period
-    lookback_days: int = Field(
-        default=90,
-        description="Number of days of activities to fetch",
-    )
+    # Random jitter applied to each poll interval (fraction of the interval)
+    jitter_ratio: float = 0.05
+
+    # Activity lookback period (days)
+    lookback_days: int = 90
 
     # Token refresh margin (seconds before expiry to refresh)
-    token_refresh_margin: int = Field(
-        default=300,
-        description="Refresh tokens this many seconds before expiry",
-    )
+    token_refresh_margin: int = 300
 
     # Token storage path
-    token_file: str = Field(
-        default="/data/tokens.json",
-        description="Path to store OAuth tokens",
-    )
+    token_file: str = "/data/tokens.json"
 
     # Logging
-    log_level: str = Field(
-        default="INFO",
-        description="Logging level",
-    )
+    log_level: str = "INFO"
+
+
+def _require(name: str) -> str:
+    """Read a required environment variable or raise a clear error."""
+    value = os.environ.get(name, "")
+    if not value:
+        raise ValueError(f"Missing required environment variable: {name}")
+    return value
 
 
 def get_settings() -> Settings:
     """Get application settings."""
-    return Settings()
+    env = os.environ
+    return Settings(
+        username=_require("XERT_USERNAME"),
+        password=_require("XERT_PASSWORD"),
+        ha_webhook_id=_require("XERT_HA_WEBHOOK_ID"),
+        ha_url=env.get("XERT_HA_URL", "http://homeassistant:8123"),
+        ha_token=env.get("XERT_HA_TOKEN", ""),
+        training_info_interval=int(env.get("XERT_TRAINING_INFO_INTERVAL", "900")),
+        activities_interval=int(env.get("XERT_ACTIVITIES_INTERVAL", "900")),
+        jitter_ratio=float(env.get("XERT_JITTER_RATIO", "0.05")),
+        lookback_days=int(env.get("XERT_LOOKBACK_DAYS", "90")),
+        token_refresh_margin=int(env.get("XERT_TOKEN_REFRESH_MARGIN", "300")),
+        token_file=env.get("XERT_TOKEN_FILE", "/data/tokens.json"),
+        log_level=env.get("XERT_LOG_LEVEL", "INFO"),
+    )
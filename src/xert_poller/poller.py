@@ -2,11 +2,15 @@
 
 import asyncio
 import hashlib
-import json
+import heapq
 import logging
+import random
 from dataclasses import dataclass, field
 from typing import Any
 
+import aiohttp
+import orjson
+
 from .api import XertAPI
 from .auth import AuthManager
 from .config import Settings
@@ -15,10 +19,27 @@ from .webhook import WebhookClient
 logger = logging.getLogger(__name__)
 
 
+# Primed digest object; .copy() is cheaper than constructing from scratch
+_HASH_BASE = hashlib.blake2b(digest_size=8)
+
+
 def _compute_hash(data: Any) -> str:
     """Compute hash of data for change detection."""
-    serialized = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(serialized.encode()).hexdigest()[:16]
+    serialized = orjson.dumps(
+        data,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    h = _HASH_BASE.copy()
+    h.update(serialized)
+    return h.hexdigest()
+
+
+def _activity_digest(activity: dict[str, Any]) -> bytes:
+    """Digest a single activity for incremental change detection."""
+    h = _HASH_BASE.copy()
+    h.update(orjson.dumps(activity, option=orjson.OPT_SORT_KEYS, default=str))
+    return h.digest()
 
 
 @dataclass
@@ -26,7 +47,7 @@ class PollerState:
     """Tracks poller state for change detection."""
 
     training_info_hash: str = ""
-    activities_hash: str = ""
+    per_activity_hash: dict[str, bytes] = field(default_factory=dict)
     last_training_info: dict[str, Any] = field(default_factory=dict)
     last_activities: dict[str, Any] = field(default_factory=dict)
 
@@ -40,19 +61,19 @@ class Poller:
         auth: AuthManager,
         api: XertAPI,
         webhook: WebhookClient,
+        stop_event: asyncio.Event | None = None,
     ):
         self.settings = settings
         self.auth = auth
         self.api = api
         self.webhook = webhook
         self.state = PollerState()
-        self._running = False
-        self._tasks: list[asyncio.Task] = []
+        self._detail_sem = asyncio.Semaphore(8)
+        self._stop = stop_event if stop_event is not None else asyncio.Event()
 
     async def start(self) -> None:
-        """Start the poller."""
+        """Start the poller and run until stop() is requested."""
         logger.info("Starting Xert poller")
-        self._running = True
 
         # Ensure we have a valid token
         token = await self.auth.ensure_valid_token()
@@ -64,40 +85,45 @@ class Poller:
         await self._poll_training_info(force_send=True)
         await self._poll_activities(force_send=True)
 
-        # Start polling tasks
-        self._tasks = [
-            asyncio.create_task(self._training_info_loop()),
-            asyncio.create_task(self._activities_loop()),
-        ]
-
-        # Wait for all tasks
-        try:
-            await asyncio.gather(*self._tasks)
-        except asyncio.CancelledError:
-            logger.info("Poller tasks cancelled")
+        # Run the polling loops; TaskGroup handles cancellation and cleanup
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._training_info_loop())
+            tg.create_task(self._activities_loop())
 
     async def stop(self) -> None:
         """Stop the poller."""
         logger.info("Stopping Xert poller")
-        self._running = False
-        for task in self._tasks:
-            task.cancel()
+        self._stop.set()
+
+    def _jittered(self, interval: int) -> float:
+        """Apply the configured random jitter to a poll interval."""
+        spread = interval * self.settings.jitter_ratio
+        return interval + random.uniform(-spread, spread)
+
+    async def _wait(self, delay: float) -> bool:
+        """Sleep for delay seconds; return False if stop was requested meanwhile."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=delay)
+            return False
+        except TimeoutError:
+            return True
 
     async def _training_info_loop(self) -> None:
         """Poll training info at configured interval."""
-        while self._running:
-            await asyncio.sleep(self.settings.training_info_interval)
+        while await self._wait(self._jittered(self.settings.training_info_interval)):
             await self._poll_training_info()
 
     async def _activities_loop(self) -> None:
         """Poll activities at configured interval."""
-        while self._running:
-            await asyncio.sleep(self.settings.activities_interval)
+        # Phase-shift by half an interval so both loops don't fire together
+        if not await self._wait(self.settings.activities_interval // 2):
+            return
+        while await self._wait(self._jittered(self.settings.activities_interval)):
             await self._poll_activities()
 
     async def _poll_training_info(self, force_send: bool = False) -> None:
         """Poll and process training info data."""
-        token = await self.auth.ensure_valid_token()
+        token = self.auth.current_token_if_valid or await self.auth.ensure_valid_token()
         if not token:
             logger.warning("No valid token for training info poll")
             return
@@ -106,8 +132,23 @@ class Poller:
         if data is None:
             return
 
-        # Check for data change
-        data_hash = _compute_hash(data)
+        # Hash only the fields the webhook consumer cares about; the response
+        # carries volatile metadata that would trigger spurious sends
+        data_hash = _compute_hash(
+            {
+                k: data.get(k)
+                for k in (
+                    "signature",
+                    "status",
+                    "tl",
+                    "targetXSS",
+                    "wotd",
+                    "weight",
+                    "source",
+                    "success",
+                )
+            }
+        )
         if force_send or data_hash != self.state.training_info_hash:
             logger.info("Training info data changed, sending webhook")
             self.state.training_info_hash = data_hash
@@ -118,7 +159,7 @@ class Poller:
 
     async def _poll_activities(self, force_send: bool = False) -> None:
         """Poll and process activities data with full details."""
-        token = await self.auth.ensure_valid_token()
+        token = self.auth.current_token_if_valid or await self.auth.ensure_valid_token()
         if not token:
             logger.warning("No valid token for activities poll")
             return
@@ -130,54 +171,99 @@ class Poller:
         # Fetch details for each activity (up to 50)
         activities = data.get("activities", [])
         if activities:
-            # Sort by start_date descending and take top 50
-            sorted_activities = sorted(
-                [a for a in activities if a.get("start_date", {}).get("date")],
-                key=lambda x: x.get("start_date", {}).get("date", ""),
-                reverse=True,
-            )[:50]
+            # Extract the sort key once per activity, then take the 50 newest
+            pairs = [
+                (a["start_date"]["date"], a)
+                for a in activities
+                if a.get("start_date", {}).get("date")
+            ]
+            sorted_activities = [a for _, a in heapq.nlargest(50, pairs, key=lambda p: p[0])]
 
-            enriched_activities = []
-            for activity in sorted_activities:
+            async def _fetch(activity: dict[str, Any]) -> dict[str, Any] | None:
                 path = activity.get("path")
-                if path:
-                    detail = await self.api.get_activity_detail(token, path)
-                    if detail and detail.get("success"):
-                        # Merge detail data into activity
-                        merged = {**activity, **detail}
-                        enriched_activities.append(merged)
-                    else:
-                        enriched_activities.append(activity)
+                if not path:
+                    return None
+                async with self._detail_sem:
+                    return await self.api.get_activity_detail(token, path)
+
+            # Fetch details concurrently, bounded by the semaphore
+            details = await asyncio.gather(
+                *(_fetch(a) for a in sorted_activities),
+                return_exceptions=True,
+            )
+
+            enriched_activities = []
+            for activity, detail in zip(sorted_activities, details):
+                if isinstance(detail, dict) and detail.get("success"):
+                    # Merge detail data into the activity in place; the decoded
+                    # activity dict isn't used anywhere else after this
+                    activity.update(detail)
+                    enriched_activities.append(activity)
                 else:
+                    if isinstance(detail, BaseException):
+                        logger.warning("Activity detail fetch failed: %s", detail)
                     enriched_activities.append(activity)
 
             data = {"success": data.get("success", True), "activities": enriched_activities}
             logger.info("Enriched %d activities with details", len(enriched_activities))
 
-        # Check for data change
-        data_hash = _compute_hash(data)
-        if force_send or data_hash != self.state.activities_hash:
+        all_activities = data.get("activities") or []
+
+        # Digest each activity independently and diff against the previous
+        # poll's map so we know exactly which activities changed
+        per_hash = {
+            str(a.get("path") or i): _activity_digest(a)
+            for i, a in enumerate(all_activities)
+        }
+        prev_hash = self.state.per_activity_hash
+        changed_paths = [p for p, d in per_hash.items() if prev_hash.get(p) != d]
+        removed_paths = prev_hash.keys() - per_hash.keys()
+        self.state.per_activity_hash = per_hash
+
+        if force_send or changed_paths or removed_paths:
+            if changed_paths:
+                logger.debug(
+                    "Changed activities: %s",
+                    ", ".join(sorted(changed_paths)[:10]),
+                )
             logger.info("Activities data changed, sending webhook")
-            self.state.activities_hash = data_hash
             self.state.last_activities = data
             await self.webhook.send_activities(data)
         else:
             logger.debug("Activities data unchanged")
 
 
-async def run_poller(settings: Settings) -> None:
-    """Run the poller with all components."""
-    async with AuthManager(
-        username=settings.username,
-        password=settings.password,
-        token_file=settings.token_file,
-        refresh_margin=settings.token_refresh_margin,
-    ) as auth:
-        async with XertAPI() as api:
-            async with WebhookClient(
-                ha_url=settings.ha_url,
-                webhook_id=settings.ha_webhook_id,
-                token=settings.ha_token,
-            ) as webhook:
-                poller = Poller(settings, auth, api, webhook)
-                await poller.start()
+async def run_poller(settings: Settings, stop_event: asyncio.Event | None = None) -> None:
+    """Run the poller with all components sharing one HTTP session.
+
+    Args:
+        settings: Application settings
+        stop_event: Optional event that terminates the poll loops when set
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        ttl_dns_cache=300,
+        keepalive_timeout=75,
+    )
+    async with aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=30),
+        json_serialize=lambda obj: orjson.dumps(obj).decode(),
+    ) as session:
+        async with AuthManager(
+            username=settings.username,
+            password=settings.password,
+            token_file=settings.token_file,
+            session=session,
+            refresh_margin=settings.token_refresh_margin,
+        ) as auth:
+            async with XertAPI(session=session) as api:
+                async with WebhookClient(
+                    ha_url=settings.ha_url,
+                    webhook_id=settings.ha_webhook_id,
+                    session=session,
+                    token=settings.ha_token,
+                ) as webhook:
+                    poller = Poller(settings, auth, api, webhook, stop_event=stop_event)
+                    await poller.start()
@@ -1,13 +1,18 @@
 """Home Assistant webhook integration."""
 
+import asyncio
+import hashlib
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import aiohttp
+import orjson
 
 logger = logging.getLogger(__name__)
 
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=30)
+
 
 @dataclass
 class WebhookClient:
@@ -15,19 +20,16 @@ class WebhookClient:
 
     ha_url: str
     webhook_id: str
+    session: aiohttp.ClientSession
     token: str = ""
-    _session: aiohttp.ClientSession | None = None
+    _last_hash_by_event: dict[str, bytes] = field(default_factory=dict)
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self._session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self._session:
-            await self._session.close()
-            self._session = None
 
     @property
     def webhook_url(self) -> str:
@@ -35,41 +37,51 @@ class WebhookClient:
         base = self.ha_url.rstrip("/")
         return f"{base}/api/webhook/{self.webhook_id}"
 
-    async def send(self, event_type: str, data: dict[str, Any]) -> bool:
+    async def send(self, event_type: str, data: dict[str, Any], dedupe_key: str | None = None) -> bool:
         """Send data to Home Assistant webhook.
 
         Args:
             event_type: Type of event (training_info, activity_list)
             data: Event data payload
+            dedupe_key: Cache key for payload dedupe; defaults to event_type.
+                Callers posting several payloads under one event type (e.g.
+                batches) must pass a distinct key per payload.
 
         Returns:
             True if successful, False otherwise
         """
-        if not self._session:
-            logger.error("Webhook client session not initialized")
-            return False
-
         payload = {
             "event_type": event_type,
             "data": data,
         }
+        dedupe_key = dedupe_key or event_type
+
+        # Skip the POST entirely if this exact wire payload was already sent
+        payload_hash = hashlib.blake2b(
+            orjson.dumps(payload, default=str), digest_size=8
+        ).digest()
+        if self._last_hash_by_event.get(dedupe_key) == payload_hash:
+            logger.debug("Webhook payload unchanged, skipping send: %s", dedupe_key)
+            return True
 
         headers = {"Content-Type": "application/json"}
         if self.token:
             headers["Authorization"] = f"Bearer {self.token}"
 
         try:
-            async with self._session.post(
+            async with self.session.post(
                 self.webhook_url,
                 json=payload,
                 headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30),
+                timeout=_REQUEST_TIMEOUT,
             ) as resp:
                 if resp.status == 200:
                     logger.debug("Webhook sent: %s", event_type)
+                    self._last_hash_by_event[dedupe_key] = payload_hash
                     return True
                 else:
-                    text = await resp.text()
+                    # Read only a capped prefix of the error body for logging
+                    text = (await resp.content.read(512)).decode("utf-8", "replace")
                     logger.warning(
                         "Webhook failed: %d - %s (event=%s)",
                         resp.status,
@@ -100,3 +112,40 @@ class WebhookClient:
                 "parsed": data,
             },
         )
+
+    async def send_activities_batched(self, data: dict[str, Any], chunk_size: int = 10) -> bool:
+        """Send activity list updates as concurrent bounded batches.
+
+        Splits the activity list into chunks of chunk_size and posts them
+        concurrently, each tagged with batch_index/batch_total so the consumer
+        can reassemble. Keeps Home Assistant's per-request JSON parse small
+        and overlaps it with our network I/O.
+
+        Args:
+            data: Dict with 'success' and 'activities' keys
+            chunk_size: Activities per webhook POST
+
+        Returns:
+            True if all batches were sent successfully, False otherwise
+        """
+        activities = data.get("activities") or []
+        if not activities:
+            return await self.send_activities(data)
+
+        chunks = [activities[i : i + chunk_size] for i in range(0, len(activities), chunk_size)]
+        results = await asyncio.gather(
+            *(
+                self.send(
+                    "xert_activity_list_update",
+                    {
+                        "available": data.get("success", False),
+                        "batch_index": i,
+                        "batch_total": len(chunks),
+                        "activities": chunk,
+                    },
+                    dedupe_key=f"xert_activity_list_update:{i}",
+                )
+                for i, chunk in enumerate(chunks)
+            )
+        )
+        return all(results)